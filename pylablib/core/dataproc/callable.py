@@ -382,7 +382,9 @@ class MethodCallable(FunctionCallable):
             raise ValueError("supplied method is unbound; use FunctionCallable instead")
         if function_signature is None:
             function_signature=function_utils.FunctionSignature.from_function(method)
-        del function_signature.arg_names[0] # remove self
+        fs=function_signature
+        function_signature=function_utils.FunctionSignature(arg_names=fs.arg_names[1:],defaults=fs.defaults,varg_name=fs.varg_name,kwarg_name=fs.kwarg_name, # remove self
+                kwonly_arg_names=fs.kwonly_arg_names,cls=fs.cls,obj=fs.obj,name=fs.name,doc=fs.doc)
         FunctionCallable.__init__(self,method,function_signature,defaults,alias)
         self._obj=function_signature.obj
     def has_arg(self, arg_name):
@@ -2,16 +2,45 @@
 Utilities for dealing with function, methods and function signatures.
 """
 
-from future.utils import viewitems
 from .py3 import textstring
 
 import inspect
-from types import MethodType
+import weakref
+from types import MethodType, FunctionType
 
 
 
 ### Function arguments introspection ###
 
+_signature_cache={True:weakref.WeakKeyDictionary(),False:weakref.WeakKeyDictionary()} # (state, signature) of simple functions, split by follow_wrapped
+_wrapper_factory_cache={} # compiled wrapper factories, keyed by (definition signature, call signature)
+_interned_names={} # argument names tuples shared between signatures
+
+def _get_function_state(func, follow_wrapped=True):
+    """
+    Get a tuple of function attributes which determine its signature.
+
+    Used to check whether a cached signature is still valid (the attributes are compared by identity).
+    """
+    ifunc=func
+    if follow_wrapped:
+        while hasattr(ifunc,"__wrapped__"):
+            ifunc=ifunc.__wrapped__
+    wrapped=None if ifunc is func else ifunc # don't store the function itself, since it is the weak cache key
+    return (func.__name__,func.__doc__,wrapped,getattr(ifunc,"__code__",None),getattr(ifunc,"__signature__",None),
+            getattr(ifunc,"__defaults__",None),getattr(ifunc,"__kwdefaults__",None))
+def _same_state(state, other):
+    """Check if two function states contain the same objects"""
+    for v,ov in zip(state,other):
+        if v is not ov:
+            return False
+    return True
+
+def _intern_names(names):
+    """Get a tuple of argument names, which is shared between all signatures with the same names"""
+    names=tuple(names)
+    return _interned_names.setdefault(names,names)
+
 class FunctionSignature(object):
     """
     Description of a function signature, including name, argument names, default values, names of varg and kwarg arguments, class and object (for methods) and docstring.
@@ -21,14 +50,19 @@ class FunctionSignature(object):
         default (dict): Dictionary ``{name: value}`` of default values.
         varg_name (str): Name of ``*varg`` parameter (``None`` means no such parameter).
         kwarg_name (str): Name of ``**kwarg`` parameter (``None`` means no such parameter). 
+        kwonly_arg_names (list): Names of the keyword-only arguments.
         cls: Caller class, for methods.
         obj: Caller object, for methods.
         name (str): Function name.
         doc (str): Function docstring. 
+
+    `arg_names` and `kwonly_arg_names` are always stored as tuples, which are shared between all signatures with the same names.
+    Hence, they can not be modified in place; to change the arguments, a new signature should be created.
     """
+    __slots__=("arg_names","kwonly_arg_names","defaults","varg_name","kwarg_name","cls","obj","name","doc","_arg_names_set","_defaults_list","_signature_strings","_max_args_cache","_bound_max_args_cache","__weakref__")
     def __init__(self, arg_names=None, defaults=None, varg_name=None, kwarg_name=None, kwonly_arg_names=None, cls=None, obj=None, name=None, doc=None):
-        self.arg_names=arg_names or []
-        self.kwonly_arg_names=kwonly_arg_names or []
+        self.arg_names=_intern_names(arg_names or ())
+        self.kwonly_arg_names=_intern_names(kwonly_arg_names or ())
         self.defaults=defaults or {}
         self.varg_name=varg_name
         self.kwarg_name=kwarg_name
@@ -36,31 +70,53 @@ class FunctionSignature(object):
         self.obj=obj
         self.name=name
         self.doc=doc
+        self._arg_names_set=frozenset(self.arg_names).union(self.kwonly_arg_names)
+        self._defaults_list=None
+        self._signature_strings={}
+        self._max_args_cache=None
+        self._bound_max_args_cache=None
+    def __getstate__(self):
+        return _get_slots_state(self,exclude=["_arg_names_set","_defaults_list","_signature_strings","_max_args_cache","_bound_max_args_cache"])
+    def __setstate__(self, state):
+        _set_slots_state(self,state)
+        self.arg_names=_intern_names(self.arg_names)
+        self.kwonly_arg_names=_intern_names(self.kwonly_arg_names)
+        self._arg_names_set=frozenset(self.arg_names).union(self.kwonly_arg_names)
+        self._defaults_list=None
+        self._signature_strings={}
+        self._max_args_cache=None
+        self._bound_max_args_cache=None
     def get_defaults_list(self):
         """
         Get list of default values for arguments in the order specified in the signature.
+
+        The list is computed on the first call and shared afterwards, so it should not be modified.
         """
-        defaults_list=[]
-        for arg in self.arg_names[::-1]:
-            if arg in self.defaults:
-                defaults_list.append(self.defaults[arg])
-        return defaults_list[::-1]
+        if self._defaults_list is None:
+            self._defaults_list=[self.defaults[a] for a in self.arg_names if a in self.defaults]
+        return self._defaults_list
     def signature(self, pass_order=None):
         """
         Get string containing a signature (arguments list) of the function (call or definition), including ``*vargs`` and ``**kwargs``.
         
         If `pass_order` is not ``None``, it specifies the order in which the arguments are passed.
         """
-        if pass_order is None:
-            args_sig=", ".join(self.arg_names)
-        else:
-            args_sig=", ".join(pass_order)
-        varg_sig=("*"+self.varg_name) if self.varg_name else ""
-        kwonly_args_sig=", ".join(["{}={}".format(n,self.defaults[n]) for n in self.kwonly_arg_names])
-        kwarg_sig=("**"+self.kwarg_name) if self.kwarg_name else ""
-        sigs=[args_sig,varg_sig,kwonly_args_sig,kwarg_sig]
-        sigs=[s for s in sigs if s!=""]
-        return ", ".join(sigs)
+        key=None if pass_order is None else tuple(pass_order)
+        sig=self._signature_strings.get(key)
+        if sig is None:
+            arg_names=self.arg_names if pass_order is None else pass_order
+            sigs=[]
+            if arg_names:
+                sigs.append(", ".join(arg_names))
+            if self.varg_name:
+                sigs.append("*"+self.varg_name)
+            if self.kwonly_arg_names:
+                sigs.append(", ".join(["{}={}".format(n,self.defaults[n]) for n in self.kwonly_arg_names]))
+            if self.kwarg_name:
+                sigs.append("**"+self.kwarg_name)
+            sig=", ".join(sigs)
+            self._signature_strings[key]=sig
+        return sig
     def wrap_function(self, func, pass_order=None):
         """
         Wrap a function `func` into a containing function with this signature.
@@ -68,17 +124,22 @@ class FunctionSignature(object):
         Sets function name, argument names, default values, object and class (for methods) and docstring.
         If `pass_order` is not ``None``, it determines the order in which the positional arguments are passed to the wrapped function.
         """
-        eval_string="lambda {0}: _func_({1})".format(self.signature(),self.signature(pass_order))
-        wrapped=eval(eval_string,{'_func_':func})
+        # always use an eval'd wrapper (even if `func` already has this signature), so that the wrapper code itself
+        # (``__code__``, ``inspect.getfullargspec``) reports the signature, which the users of :func:`getargsfrom` rely on
+        factory_key=(self.signature(),self.signature(pass_order))
+        factory=_wrapper_factory_cache.get(factory_key)
+        if factory is None:
+            eval_string="lambda _func_: lambda {0}: _func_({1})".format(*factory_key)
+            factory=eval(eval_string,{})
+            _wrapper_factory_cache[factory_key]=factory
+        wrapped=factory(func)
         wrapped.__defaults__=tuple(self.get_defaults_list())
         if self.doc:
             wrapped.__doc__=self.doc
         else:
             wrapped.__doc__=func.__doc__
-        if self.name:
-            wrapped.__name__=self.name
-        else:
-            wrapped.__name__=func.__name__
+        wrapped.__name__=self.name or func.__name__
+        wrapped.__qualname__=wrapped.__name__ # otherwise shows the wrapper factory lambdas
         if self.obj is not None:
             wrapped=MethodType(wrapped,self.obj)
         return wrapped
@@ -101,13 +162,19 @@ class FunctionSignature(object):
         Args:
             include_positional (bool): If ``True`` and function accepts ``*vargs``, return ``None`` (unlimited number of arguments).
             include_keywords (bool): If ``True`` and function accepts ``**kwargs``, return ``None`` (unlimited number of arguments).
+
+        The results for all combinations of `include_positional` and `include_keywords` are computed on the first call and cached.
         """
-        if (include_positional and self.varg_name is not None) or (include_keywords and self.kwarg_name is not None):
-            return None
-        if self.obj is not None:
-            return len(self.arg_names)-1
-        else:
-            return len(self.arg_names)
+        if self._max_args_cache is None:
+            self._max_args_cache=self._get_max_args(self.obj is not None)
+        return self._max_args_cache[2*bool(include_positional)+bool(include_keywords)]
+    def _get_max_args(self, bound):
+        """Get the results of :meth:`max_args_num` for all argument combinations (`bound` determines whether the signature is for a bound method)"""
+        max_args=len(self.arg_names)-1 if bound else len(self.arg_names)
+        max_args_pos=None if self.varg_name is not None else max_args
+        max_args_kw=None if self.kwarg_name is not None else max_args
+        max_args_all=None if (max_args_pos is None or max_args_kw is None) else max_args
+        return (max_args,max_args_kw,max_args_pos,max_args_all)
     
     @staticmethod
     def from_function(func, follow_wrapped=True):
@@ -116,31 +183,55 @@ class FunctionSignature(object):
 
         If ``follow_wrapped==True``, follow ``__wrapped__`` attributes until the innermost function
         (useful for getting signatures of functions wrapped using ``functools`` methods).
+
+        Signatures of Python functions and methods are cached, so the returned object can be shared between different calls;
+        it should not be modified in place (use :meth:`copy` to get an independent signature).
+        The cached signature is recalculated if the function name, docstring, code, default values, ``__signature__`` or ``__wrapped__`` attributes get reassigned.
         """
+        base_func=func.__func__ if isinstance(func,MethodType) else func
+        if not isinstance(base_func,FunctionType):
+            return FunctionSignature._from_function(func,follow_wrapped=follow_wrapped)
+        cache=_signature_cache[follow_wrapped]
+        state=_get_function_state(base_func,follow_wrapped=follow_wrapped)
+        entry=cache.get(base_func)
+        if entry is None or not _same_state(entry[0],state):
+            entry=state,FunctionSignature._from_function(base_func,follow_wrapped=follow_wrapped)
+            cache[base_func]=entry
+        return entry[1]._rebind(func)
+    @staticmethod
+    def _from_function(func, follow_wrapped=True):
+        """Get signature of the given function or method without using the cache"""
         ifunc=func
         if follow_wrapped:
             while hasattr(ifunc,"__wrapped__"):
                 ifunc=ifunc.__wrapped__
-        try:
-            try:
-                args=inspect.getfullargspec(ifunc)
-            except TypeError:
-                ifunc=ifunc.__call__
-                args=inspect.getfullargspec(ifunc)
-            defaults=dict(zip(args.args[::-1],args.defaults[::-1])) if args.defaults else {}
-            if args.kwonlydefaults:
-                defaults.update(args.kwonlydefaults)
-            kwonly_arg_names=args.kwonlyargs
-            kwargs=args.varkw
-        except AttributeError:
+        if hasattr(inspect,"signature"):
+            if isinstance(ifunc,MethodType): # keep the bound argument (e.g., ``self``) in the argument list
+                ifunc=ifunc.__func__
+            arg_names,kwonly_arg_names,defaults,varg_name,kwarg_name=[],[],{},None,None
+            for p in inspect.signature(ifunc,follow_wrapped=False).parameters.values():
+                if p.kind==p.VAR_POSITIONAL:
+                    varg_name=p.name
+                elif p.kind==p.VAR_KEYWORD:
+                    kwarg_name=p.name
+                else:
+                    if p.kind==p.KEYWORD_ONLY:
+                        kwonly_arg_names.append(p.name)
+                    else:
+                        arg_names.append(p.name)
+                    if p.default is not p.empty:
+                        defaults[p.name]=p.default
+        else: # Python 2
             try:
                 args=inspect.getargspec(ifunc)
             except TypeError:
                 ifunc=ifunc.__call__
                 args=inspect.getargspec(ifunc)
+            arg_names=args.args
             defaults=args.defaults and dict(zip(args.args[::-1],args.defaults[::-1]))
             kwonly_arg_names=None
-            kwargs=args.keywords
+            varg_name=args.varargs
+            kwarg_name=args.keywords
         try:
             cls=func.__self__.__class__
             obj=func.__self__
@@ -148,12 +239,38 @@ class FunctionSignature(object):
         except AttributeError:
             cls=None
             obj=None
-        return FunctionSignature(arg_names=args.args,defaults=defaults,varg_name=args.varargs,kwarg_name=kwargs,kwonly_arg_names=kwonly_arg_names,
+        return FunctionSignature(arg_names=arg_names,defaults=defaults,varg_name=varg_name,kwarg_name=kwarg_name,kwonly_arg_names=kwonly_arg_names,
             cls=cls,obj=obj,name=func.__name__,doc=func.__doc__)
     def copy(self):
         """Return a copy"""
         return FunctionSignature(arg_names=self.arg_names,defaults=self.defaults,varg_name=self.varg_name,kwarg_name=self.kwarg_name,kwonly_arg_names=self.kwonly_arg_names,
                 cls=self.cls,obj=self.obj,name=self.name,doc=self.doc)
+    def _rebind(self, func):
+        """
+        Get the signature corresponding to the method `func` of the same underlying function.
+
+        If `func` is not a method, return unchanged; otherwise, return a shallow copy with the class and object taken from `func`.
+        The copy shares the argument names and the precomputed values with this signature, so it is created without going through the constructor.
+        """
+        if not isinstance(func,MethodType):
+            return self
+        if self._bound_max_args_cache is None:
+            self._bound_max_args_cache=self._get_max_args(True)
+        sig=FunctionSignature.__new__(FunctionSignature)
+        sig.arg_names=self.arg_names
+        sig.kwonly_arg_names=self.kwonly_arg_names
+        sig.defaults=self.defaults
+        sig.varg_name=self.varg_name
+        sig.kwarg_name=self.kwarg_name
+        sig.cls=func.__self__.__class__
+        sig.obj=func.__self__
+        sig.name=self.name
+        sig.doc=self.doc
+        sig._arg_names_set=self._arg_names_set
+        sig._defaults_list=self.get_defaults_list()
+        sig._signature_strings=self._signature_strings
+        sig._max_args_cache=sig._bound_max_args_cache=self._bound_max_args_cache
+        return sig
     def as_simple_func(self):
         """
         Turn the signature into a simple function (as opposed to a bound method).
@@ -197,20 +314,20 @@ class FunctionSignature(object):
         if hide_outer_obj:
             outer=outer.as_simple_func()
         if add_place=="back":
-            arg_names=inner.arg_names+[a for a in outer.arg_names if not a in inner.arg_names]
+            arg_names=list(inner.arg_names)+[a for a in outer.arg_names if not a in inner.arg_names]
         elif add_place=="front":
-            arg_names=outer.arg_names+[a for a in inner.arg_names if not a in outer.arg_names]
+            arg_names=list(outer.arg_names)+[a for a in inner.arg_names if not a in outer.arg_names]
         else:
             raise ValueError("unrecognized add_place: {0}".format(add_place))
-        kwonly_arg_names=inner.kwonly_arg_names+[a for a in outer.kwonly_arg_names if not a in inner.kwonly_arg_names]
+        kwonly_arg_names=list(inner.kwonly_arg_names)+[a for a in outer.kwonly_arg_names if not a in inner.kwonly_arg_names]
         if (inner.obj is None) and (outer.obj is not None): # hide "self" argument from the inner function, as it will be bound later
             out_arg_names=outer.arg_names[1:]
         else:
             out_arg_names=outer.arg_names
         if merge_duplicates:
-            pass_order=inner.arg_names+[a for a in out_arg_names if not a in inner.arg_names]
+            pass_order=list(inner.arg_names)+[a for a in out_arg_names if not a in inner.arg_names]
         else:
-            pass_order=inner.arg_names+out_arg_names
+            pass_order=list(inner.arg_names)+list(out_arg_names)
         defaults=inner.defaults.copy()
         defaults.update(outer.defaults)
         varg_name =outer.varg_name  if "varg_name"  in overwrite else inner.varg_name
@@ -226,6 +343,17 @@ class FunctionSignature(object):
 def funcsig(func, follow_wrapped=True):
     """Return a function signature object"""
     return FunctionSignature.from_function(func,follow_wrapped=follow_wrapped)
+
+def precompute_signatures(funcs, follow_wrapped=True):
+    """
+    Precompute signatures of the given functions or methods and store them in the signature cache.
+
+    Useful to move the introspection cost to the definition time (e.g., module import) instead of the first call.
+    Only Python functions and methods are cached; other callables (e.g., builtins, callable class instances, or :func:`functools.partial` objects)
+    are still inspected on every call, so precomputing their signatures has no effect.
+    """
+    for func in funcs:
+        FunctionSignature.from_function(func,follow_wrapped=follow_wrapped)
     
 def getargsfrom(source, **merge_params):
     """
@@ -248,7 +376,11 @@ def getargsfrom(source, **merge_params):
     out_sig=FunctionSignature.from_function(source)
     def wrapper(dest):
         in_sig=FunctionSignature.from_function(dest)
-        full_sig,pass_order=FunctionSignature.merge(in_sig,out_sig,**merge_params)
+        if not (merge_params or in_sig.arg_names or in_sig.kwonly_arg_names): # universal function; merging results in the source signature
+            full_sig=out_sig
+            pass_order=out_sig.arg_names[1:] if (in_sig.obj is None and out_sig.obj is not None) else out_sig.arg_names
+        else:
+            full_sig,pass_order=FunctionSignature.merge(in_sig,out_sig,**merge_params)
         return full_sig.wrap_function(dest,pass_order=pass_order)
     return wrapper
 
@@ -260,11 +392,7 @@ def call_cut_args(func, *args, **kwargs):
     if sig.kwarg_name is not None:
         cut_kwargs=kwargs
     else:
-        cut_kwargs={}
-        arg_names=sig.arg_names+sig.kwonly_arg_names
-        for n,v in viewitems(kwargs):
-            if n in arg_names:
-                cut_kwargs[n]=v
+        cut_kwargs={n:kwargs[n] for n in sig._arg_names_set.intersection(kwargs)}
     max_args_num=sig.max_args_num()
     if max_args_num is None:
         return func(*args,**cut_kwargs)
@@ -276,16 +404,33 @@ def call_cut_args(func, *args, **kwargs):
 
 ### Functions for accessing object attributes ###
 
+def _get_accessors(cls, attr_name):
+    """
+    Get the accessors ``(fget, fset, fdel)`` of the attribute `attr_name` of the class `cls`.
+
+    Any descriptor with `fget`, `fset` or `fdel` attributes (e.g., a property) is recognized; the missing accessors are ``None``.
+    """
+    descr=getattr(cls,attr_name,None)
+    return getattr(descr,"fget",None),getattr(descr,"fset",None),getattr(descr,"fdel",None)
+def _get_class_accessors(cls, attr_name):
+    """
+    Get the tuple ``(cls, fget, fset, fdel)`` with the accessors of the attribute `attr_name` of the class `cls`.
+
+    Used as a single-entry cache in the attribute calls and properties (the class is kept to check if the entry is still valid).
+    """
+    return (cls,)+_get_accessors(cls,attr_name)
+_no_accessors=(None,None,None,None) # empty single-entry accessors cache
+
 def getattr_call(obj, attr_name, *args, **vargs):
     """
     Call the getter for the attribute `attr_name` of `obj`.
 
     If the attribute is a property, pass ``*args`` and ``**kwargs`` to the getter (`fget`); otherwise, ignore them.
     """
-    try:
-        return getattr(type(obj),attr_name).fget(obj,*args,**vargs)
-    except AttributeError:
+    fget=getattr(getattr(type(obj),attr_name,None),"fget",None)
+    if fget is None:
         return getattr(obj,attr_name)
+    return fget(obj,*args,**vargs)
 def setattr_call(obj, attr_name, *args, **vargs):
     """
     Call the setter for the attribute `attr_name` of `obj`.
@@ -293,32 +438,47 @@ def setattr_call(obj, attr_name, *args, **vargs):
     If the attribute is a propert, pass ``*args`` and ``**kwargs`` to the setter (`fset`);
     otherwise, the set value is assumed to be either the first argument, or the keyword argument with the name ``'value'``.
     """
-    try:
-        return getattr(type(obj),attr_name).fset(obj,*args,**vargs)
-    except AttributeError:
+    fset=getattr(getattr(type(obj),attr_name,None),"fset",None)
+    if fset is None:
         value=args[0] if len(args)>0 else vargs["value"]
         return setattr(obj,attr_name,value)
+    return fset(obj,*args,**vargs)
 def delattr_call(obj, attr_name, *args, **vargs):
     """
     Call the deleter for the attribute `attr_name` of `obj`.
 
     If the attribute is a property, pass ``*args`` and ``**kwargs`` to the deleter (`fdel`); otherwise, ignore them.
     """
-    try:
-        return getattr(type(obj),attr_name).fdel(obj,*args,**vargs)
-    except AttributeError:
+    fdel=getattr(getattr(type(obj),attr_name,None),"fdel",None)
+    if fdel is None:
         return delattr(obj,attr_name)
+    return fdel(obj,*args,**vargs)
 
 
 
 ### Universal wrappers for object calls (includes methods, attributes and properties) ###
 
+def _get_slots_state(obj, exclude=()):
+    """Get a dictionary with all assigned slots and ``__dict__`` attributes of `obj` (except for the ones in `exclude`)"""
+    state=dict(getattr(obj,"__dict__",{}))
+    for c in type(obj).__mro__:
+        for n in c.__dict__.get("__slots__",()):
+            if n not in exclude and n!="__weakref__" and hasattr(obj,n):
+                state[n]=getattr(obj,n)
+    return state
+def _set_slots_state(obj, state):
+    """Restore attributes of `obj` from the `state` dictionary generated by :func:`_get_slots_state`"""
+    for n,v in state.items():
+        setattr(obj,n,v)
+
+
 class IObjectCall(object):
     """
     Universal interface for object method call (makes methods, attributes and properties look like methods).
     
     Should be called with an object as a first argument.
     """
+    __slots__=("__weakref__",)
     def __init__(self):
         object.__init__(self)
     def __call__(self, obj, *args, **vargs):
@@ -330,7 +490,15 @@ class MethodObjectCall(IObjectCall):
     
     Args:
         method: Either a method object or a method name which is used for the call.
+
+    On creation, the call is specialized depending on the `method` kind, so no checks are done on every call.
     """
+    __slots__=("method","named")
+    def __new__(cls, *args, **kwargs):
+        if cls is MethodObjectCall:
+            method=args[0] if args else kwargs.get("method")
+            cls=_NamedMethodObjectCall if isinstance(method,textstring) else _DirectMethodObjectCall
+        return IObjectCall.__new__(cls)
     def __init__(self, method):
         IObjectCall.__init__(self)
         self.method=method
@@ -340,9 +508,22 @@ class MethodObjectCall(IObjectCall):
         Call this method for the object `obj` with the given arguments.
         """
         if self.named:
-            return getattr(obj,self.method)(*args,**vargs)
+            return self._call_named(obj,*args,**vargs)
         else:
-            return self.method(obj,*args,**vargs)
+            return self._call_direct(obj,*args,**vargs)
+    def _call_named(self, obj, *args, **vargs):
+        # plain getattr is used on purpose: on CPython 3.x it is not slower (and often faster) than a pre-built operator.attrgetter
+        return getattr(obj,self.method)(*args,**vargs)
+    def _call_direct(self, obj, *args, **vargs):
+        return self.method(obj,*args,**vargs)
+class _NamedMethodObjectCall(MethodObjectCall):
+    """:class:`MethodObjectCall` specialized for a method name"""
+    __slots__=()
+    __call__=MethodObjectCall._call_named
+class _DirectMethodObjectCall(MethodObjectCall):
+    """:class:`MethodObjectCall` specialized for a method object"""
+    __slots__=()
+    __call__=MethodObjectCall._call_direct
 class AttrObjectCall(IObjectCall):
     """
     Object call created from an object attribute (makes attributes and properties look like methods).
@@ -354,11 +535,26 @@ class AttrObjectCall(IObjectCall):
     If an attribute is a simple attribute, than getter gets no arguments and setter gets one argument
     (either the first argument, or the keyword argument named ``'value'``).
     If it's a property, pass all the parameters to the property call.
+
+    On creation, the call is specialized to either getter or setter.
+    The attribute accessors (e.g., property getter and setter) are looked up on the first call and reused while the object class stays the same.
     """
+    __slots__=("name","as_getter","_accessors")
+    def __new__(cls, *args, **kwargs):
+        if cls is AttrObjectCall:
+            as_getter=args[1] if len(args)>1 else kwargs.get("as_getter",True)
+            cls=_AttrObjectGetterCall if as_getter else _AttrObjectSetterCall
+        return IObjectCall.__new__(cls)
     def __init__(self, name, as_getter):
         IObjectCall.__init__(self)
         self.name=name
         self.as_getter=as_getter
+        self._accessors=_no_accessors
+    def __getstate__(self):
+        return _get_slots_state(self,exclude=["_accessors"])
+    def __setstate__(self, state):
+        _set_slots_state(self,state)
+        self._accessors=_no_accessors
     def __call__(self, obj, *args, **vargs):
         """
         Access this attribute of the object `obj`.
@@ -368,16 +564,34 @@ class AttrObjectCall(IObjectCall):
         If it's a property, pass all the parameters to the property call (`fget` or `fset`).
         """
         if self.as_getter:
-            try:
-                return getattr(type(obj),self.name).fget(obj,*args,**vargs)
-            except AttributeError:
-                return getattr(obj,self.name)
+            return self._call_getter(obj,*args,**vargs)
         else:
-            try:
-                return getattr(type(obj),self.name).fset(obj,*args,**vargs)
-            except AttributeError:
-                value=args[0] if len(args)>0 else vargs["value"]
-                return setattr(obj,self.name,value)
+            return self._call_setter(obj,*args,**vargs)
+    def _call_getter(self, obj, *args, **vargs):
+        accessors=self._accessors
+        if accessors[0] is not type(obj):
+            accessors=self._accessors=_get_class_accessors(type(obj),self.name)
+        fget=accessors[1]
+        if fget is None:
+            return getattr(obj,self.name)
+        return fget(obj,*args,**vargs)
+    def _call_setter(self, obj, *args, **vargs):
+        accessors=self._accessors
+        if accessors[0] is not type(obj):
+            accessors=self._accessors=_get_class_accessors(type(obj),self.name)
+        fset=accessors[2]
+        if fset is None:
+            value=args[0] if len(args)>0 else vargs["value"]
+            return setattr(obj,self.name,value)
+        return fset(obj,*args,**vargs)
+class _AttrObjectGetterCall(AttrObjectCall):
+    """:class:`AttrObjectCall` specialized for the getter"""
+    __slots__=()
+    __call__=AttrObjectCall._call_getter
+class _AttrObjectSetterCall(AttrObjectCall):
+    """:class:`AttrObjectCall` specialized for the setter"""
+    __slots__=()
+    __call__=AttrObjectCall._call_setter
 
 
 
@@ -389,6 +603,7 @@ class IObjectProperty(object):
     
     Can be used to get, set or remove a property.
     """
+    __slots__=("__weakref__",)
     def __init__(self):
         object.__init__(self)
     def __call__(self, obj, *args):
@@ -413,7 +628,15 @@ class MethodObjectProperty(IObjectProperty):
         remover (callable): Method invoked on ``rem()``. If ``None``, raise :exc:`RuntimeError` when called.
         expand_tuple (bool): If ``True`` and if the first argument in the method call is a tuple,
             expand it as an argument list for the underlying function call.
+
+    On creation, the implementations of ``get``, ``set`` and ``rem`` are specialized depending on `expand_tuple`.
     """
+    __slots__=("getter","setter","remover","expand_tuple")
+    def __new__(cls, *args, **kwargs):
+        if cls is MethodObjectProperty:
+            expand_tuple=args[3] if len(args)>3 else kwargs.get("expand_tuple",True)
+            cls=_ExpandMethodObjectProperty if expand_tuple else _PlainMethodObjectProperty
+        return IObjectProperty.__new__(cls)
     def __init__(self, getter=None, setter=None, remover=None, expand_tuple=True):
         IObjectProperty.__init__(self)
         self.setter=MethodObjectCall(setter) if setter else None
@@ -421,28 +644,67 @@ class MethodObjectProperty(IObjectProperty):
         self.remover=MethodObjectCall(remover) if remover else None
         self.expand_tuple=expand_tuple
     def get(self, obj, params=None):
-        if self.getter:
-            if params is not None:
-                if self.expand_tuple and isinstance(params,tuple):
-                    return self.getter(obj,*params)
-                return self.getter(obj,params)
-            return self.getter(obj)
-        raise RuntimeError("getter is not supplied")
+        if self.expand_tuple:
+            return self._get_expand(obj,params)
+        return self._get_plain(obj,params)
     def set(self, obj, value):
-        if self.setter:
-            if self.expand_tuple and isinstance(value,tuple):
-                return self.setter(obj,*value)
-            else:
-                return self.setter(obj,value)
-        raise RuntimeError("setter is not supplied")
+        if self.expand_tuple:
+            return self._set_expand(obj,value)
+        return self._set_plain(obj,value)
     def rem(self, obj, params=None):
-        if self.remover:
-            if params is not None:
-                if self.expand_tuple and isinstance(params,tuple):
-                    return self.remover(obj,*params)
-                return self.remover(obj,params)
-            return self.remover(obj, *params)
-        raise RuntimeError("remover is not supplied")
+        if self.expand_tuple:
+            return self._rem_expand(obj,params)
+        return self._rem_plain(obj,params)
+    def _get_plain(self, obj, params=None):
+        if self.getter is None:
+            raise RuntimeError("getter is not supplied")
+        if params is None:
+            return self.getter(obj)
+        return self.getter(obj,params)
+    def _get_expand(self, obj, params=None):
+        if self.getter is None:
+            raise RuntimeError("getter is not supplied")
+        if params is None:
+            return self.getter(obj)
+        if isinstance(params,tuple):
+            return self.getter(obj,*params)
+        return self.getter(obj,params)
+    def _set_plain(self, obj, value):
+        if self.setter is None:
+            raise RuntimeError("setter is not supplied")
+        return self.setter(obj,value)
+    def _set_expand(self, obj, value):
+        if self.setter is None:
+            raise RuntimeError("setter is not supplied")
+        if isinstance(value,tuple):
+            return self.setter(obj,*value)
+        return self.setter(obj,value)
+    def _rem_plain(self, obj, params=None):
+        if self.remover is None:
+            raise RuntimeError("remover is not supplied")
+        if params is None:
+            return self.remover(obj)
+        return self.remover(obj,params)
+    def _rem_expand(self, obj, params=None):
+        if self.remover is None:
+            raise RuntimeError("remover is not supplied")
+        if params is None:
+            return self.remover(obj)
+        if isinstance(params,tuple):
+            return self.remover(obj,*params)
+        return self.remover(obj,params)
+class _ExpandMethodObjectProperty(MethodObjectProperty):
+    """:class:`MethodObjectProperty` specialized for tuple expansion"""
+    __slots__=()
+    get=MethodObjectProperty._get_expand
+    set=MethodObjectProperty._set_expand
+    rem=MethodObjectProperty._rem_expand
+class _PlainMethodObjectProperty(MethodObjectProperty):
+    """:class:`MethodObjectProperty` specialized for no tuple expansion"""
+    __slots__=()
+    get=MethodObjectProperty._get_plain
+    set=MethodObjectProperty._set_plain
+    rem=MethodObjectProperty._rem_plain
 class AttrObjectProperty(IObjectProperty):
     """
     Object property created from object attribute. Works with attributes or properties.
@@ -454,7 +716,16 @@ class AttrObjectProperty(IObjectProperty):
         use_remover (bool): If ``False``, raise :exc:`RuntimeError` when calling ``rem`` method.
         expand_tuple (bool): If ``True`` and if the first argument in the method call is a tuple,
             expand it as an argument list for the underlying function call.
+
+    On creation, the implementations of ``get``, ``set`` and ``rem`` are specialized depending on `expand_tuple`.
+    The attribute accessors (e.g., property getter and setter) are looked up on the first access and reused while the object class stays the same.
     """
+    __slots__=("name","use_getter","use_setter","use_remover","expand_tuple","_accessors")
+    def __new__(cls, *args, **kwargs):
+        if cls is AttrObjectProperty:
+            expand_tuple=args[4] if len(args)>4 else kwargs.get("expand_tuple",True)
+            cls=_ExpandAttrObjectProperty if expand_tuple else _PlainAttrObjectProperty
+        return IObjectProperty.__new__(cls)
     def __init__(self, name, use_getter=True, use_setter=True, use_remover=True, expand_tuple=True):
         IObjectProperty.__init__(self)
         self.name=name
@@ -462,42 +733,112 @@ class AttrObjectProperty(IObjectProperty):
         self.use_setter=use_setter
         self.use_remover=use_remover
         self.expand_tuple=expand_tuple
+        self._accessors=_no_accessors
+    def __getstate__(self):
+        return _get_slots_state(self,exclude=["_accessors"])
+    def __setstate__(self, state):
+        _set_slots_state(self,state)
+        self._accessors=_no_accessors
     def get(self, obj, params=None):
-        if self.use_getter:
-            try:
-                if params is None:
-                    return getattr(type(obj),self.name).fget(obj)
-                elif self.expand_tuple and isinstance(params,tuple):
-                    return getattr(type(obj),self.name).fget(obj,*params)
-                else:
-                    return getattr(type(obj),self.name).fget(obj,params)
-            except AttributeError:
-                return getattr(obj,self.name)
-        raise RuntimeError("getter is not supplied")
+        if self.expand_tuple:
+            return self._get_expand(obj,params)
+        return self._get_plain(obj,params)
     def set(self, obj, value):
-        if self.use_setter:
-            try:
-                if self.expand_tuple and isinstance(value,tuple):
-                    return getattr(type(obj),self.name).fset(obj,*value)
-                else:
-                    return getattr(type(obj),self.name).fset(obj,value)
-            except AttributeError:
-                if self.expand_tuple and isinstance(value,tuple):
-                    return setattr(obj,self.name,value[0])
-                return setattr(obj,self.name,value)
-        raise RuntimeError("setter is not supplied")
+        if self.expand_tuple:
+            return self._set_expand(obj,value)
+        return self._set_plain(obj,value)
     def rem(self, obj, params=None):
-        if self.use_remover:
-            try:
-                if params is None:
-                    return getattr(type(obj),self.name).fdel(obj)
-                elif self.expand_tuple and isinstance(params,tuple):
-                    return getattr(type(obj),self.name).fdel(obj,*params)
-                else:
-                    return getattr(type(obj),self.name).fdel(obj,params)
-            except AttributeError:
-                return delattr(obj,self.name)
-        raise RuntimeError("remover is not supplied")
+        if self.expand_tuple:
+            return self._rem_expand(obj,params)
+        return self._rem_plain(obj,params)
+    def _get_plain(self, obj, params=None):
+        if not self.use_getter:
+            raise RuntimeError("getter is not supplied")
+        accessors=self._accessors
+        if accessors[0] is not type(obj):
+            accessors=self._accessors=_get_class_accessors(type(obj),self.name)
+        fget=accessors[1]
+        if fget is None:
+            return getattr(obj,self.name)
+        if params is None:
+            return fget(obj)
+        return fget(obj,params)
+    def _get_expand(self, obj, params=None):
+        if not self.use_getter:
+            raise RuntimeError("getter is not supplied")
+        accessors=self._accessors
+        if accessors[0] is not type(obj):
+            accessors=self._accessors=_get_class_accessors(type(obj),self.name)
+        fget=accessors[1]
+        if fget is None:
+            return getattr(obj,self.name)
+        if params is None:
+            return fget(obj)
+        if isinstance(params,tuple):
+            return fget(obj,*params)
+        return fget(obj,params)
+    def _set_plain(self, obj, value):
+        if not self.use_setter:
+            raise RuntimeError("setter is not supplied")
+        accessors=self._accessors
+        if accessors[0] is not type(obj):
+            accessors=self._accessors=_get_class_accessors(type(obj),self.name)
+        fset=accessors[2]
+        if fset is None:
+            return setattr(obj,self.name,value)
+        return fset(obj,value)
+    def _set_expand(self, obj, value):
+        if not self.use_setter:
+            raise RuntimeError("setter is not supplied")
+        accessors=self._accessors
+        if accessors[0] is not type(obj):
+            accessors=self._accessors=_get_class_accessors(type(obj),self.name)
+        fset=accessors[2]
+        if isinstance(value,tuple):
+            if fset is None:
+                return setattr(obj,self.name,value[0])
+            return fset(obj,*value)
+        if fset is None:
+            return setattr(obj,self.name,value)
+        return fset(obj,value)
+    def _rem_plain(self, obj, params=None):
+        if not self.use_remover:
+            raise RuntimeError("remover is not supplied")
+        accessors=self._accessors
+        if accessors[0] is not type(obj):
+            accessors=self._accessors=_get_class_accessors(type(obj),self.name)
+        fdel=accessors[3]
+        if fdel is None:
+            return delattr(obj,self.name)
+        if params is None:
+            return fdel(obj)
+        return fdel(obj,params)
+    def _rem_expand(self, obj, params=None):
+        if not self.use_remover:
+            raise RuntimeError("remover is not supplied")
+        accessors=self._accessors
+        if accessors[0] is not type(obj):
+            accessors=self._accessors=_get_class_accessors(type(obj),self.name)
+        fdel=accessors[3]
+        if fdel is None:
+            return delattr(obj,self.name)
+        if params is None:
+            return fdel(obj)
+        if isinstance(params,tuple):
+            return fdel(obj,*params)
+        return fdel(obj,params)
+class _ExpandAttrObjectProperty(AttrObjectProperty):
+    """:class:`AttrObjectProperty` specialized for tuple expansion"""
+    __slots__=()
+    get=AttrObjectProperty._get_expand
+    set=AttrObjectProperty._set_expand
+    rem=AttrObjectProperty._rem_expand
+class _PlainAttrObjectProperty(AttrObjectProperty):
+    """:class:`AttrObjectProperty` specialized for no tuple expansion"""
+    __slots__=()
+    get=AttrObjectProperty._get_plain
+    set=AttrObjectProperty._set_plain
+    rem=AttrObjectProperty._rem_plain
 
 def empty_object_property(value=None):
     """
@@ -543,18 +884,50 @@ def as_obj_prop(value):
 
 ##### Delayed definition #####
 
-def delaydef(gen):
+def _jit_compile(func, signature=None):
+    """
+    Compile `func` using Numba ``njit`` (with the given `signature`, if supplied).
+
+    If Numba is not available, return `func` unchanged.
+    """
+    try:
+        import numba as nb
+    except ImportError:
+        return func
+    if signature is None:
+        return nb.njit(func)
+    return nb.njit(signature)(func)
+
+def delaydef(gen=None, jit=False, signature=None):
     """
     Wrapper for a delayed definition of a function inside of a module.
     
     Useful if defining a function is computationally costly.
     The wrapped function should be a generator of the target function rather than the function itself.
     
-    On the first call the generator is executed to define the target function, which is then substituted for all subsequent calls.
+    On the first call the generator is executed to define the target function, which is then substituted for all subsequent calls:
+    it replaces the wrapper in the module where the generator is defined, and the wrapper's ``__wrapped__`` attribute is set to it
+    (so the references to the wrapper obtained before the first call can be unwrapped, and the wrapper only forwards the calls afterwards).
+    If ``jit==True``, the target function is compiled using Numba ``njit`` with the given `signature` (if Numba is not available, it is used as is).
+
+    Since the target function is not known before the first call, the wrapper takes the signature of the generator,
+    while the generator itself is called without arguments.
+    Hence, if the target function takes arguments, the generator should accept them as well (e.g., be defined as ``gen(*args, **kwargs)``).
+
+    Can be used either directly (``@delaydef``), or with parameters (``@delaydef(jit=True)``).
     """
-    @getargsfrom(gen)
+    if gen is None:
+        return lambda g: delaydef(g,jit=jit,signature=signature)
+    generated=[]
     def wrapped(*args, **kwargs):
-        func=gen()
-        globals()[gen.__name__]=func
-        return func(*args,**kwargs)
-    return wrapped
\ No newline at end of file
+        if not generated:
+            func=gen()
+            if jit:
+                func=_jit_compile(func,signature=signature)
+            generated.append(func)
+            delayed.__wrapped__=func
+            if gen.__globals__.get(gen.__name__) is delayed:
+                gen.__globals__[gen.__name__]=func
+        return generated[0](*args,**kwargs)
+    delayed=getargsfrom(gen)(wrapped)
+    return delayed
@@ -72,4 +72,334 @@ def test_string():
     assert string.from_string("(1,2,3+4j,(3+4j),[5,6,(7,8)],{'a':9,'b':10})")==(1,2,3+4j,(3+4j,),[5,6,(7,8)],{'a':9,'b':10})
     assert string.from_string("(1,2,(3+4j),(3+4j,),[5,6,(7,8)],{'a':9,'b':10})",parenthesis_rules="python")==(1,2,3+4j,(3+4j,),[5,6,(7,8)],{'a':9,'b':10})
     for pr in ["text","python"]:
-        assert string.from_string(string.to_string(tuple(varlst),parenthesis_rules=pr),parenthesis_rules=pr)==tuple(varlst)
\ No newline at end of file
+        assert string.from_string(string.to_string(tuple(varlst),parenthesis_rules=pr),parenthesis_rules=pr)==tuple(varlst)
+
+
+
+##### Functions tests #####
+
+from pylablib.core.utils import functions
+import weakref, gc, pickle, sys, types, functools, inspect
+
+def test_funcsig_cache():
+    """Test caching and cache invalidation of function signatures"""
+    def f(a, b=1):
+        return a+b
+    sig=functions.funcsig(f)
+    assert functions.funcsig(f) is sig
+    assert list(sig.arg_names)==["a","b"]
+    assert sig.defaults=={"b":1}
+    f.__defaults__=(5,)
+    assert functions.funcsig(f).defaults=={"b":5}
+    f.__doc__="new doc"
+    assert functions.funcsig(f).doc=="new doc"
+    def f2(a, b):
+        return a+b
+    def h(x, y, z):
+        return x+y+z
+    assert list(functions.funcsig(f2).arg_names)==["a","b"]
+    f2.__code__=h.__code__
+    assert list(functions.funcsig(f2).arg_names)==["x","y","z"]
+    assert functions.call_cut_args(f2,1,2,3,4)==6
+    f2.__signature__=inspect.signature(lambda u, v=2: None)
+    assert list(functions.funcsig(f2).arg_names)==["u","v"]
+    def g(*args, **kwargs):
+        return f(*args,**kwargs)
+    assert list(functions.funcsig(g).arg_names)==[]
+    g.__wrapped__=f
+    assert list(functions.funcsig(g).arg_names)==["a","b"]
+    assert list(functions.funcsig(g,follow_wrapped=False).arg_names)==[]
+    def h(x):
+        return x
+    functions.funcsig(h)
+    href=weakref.ref(h)
+    del h
+    gc.collect()
+    assert href() is None
+
+def test_funcsig_methods():
+    """Test signatures of methods sharing the cached function signature"""
+    class C(object):
+        def m(self, x, y=2):
+            return x+y
+    c1,c2=C(),C()
+    sig1,sig2=functions.funcsig(c1.m),functions.funcsig(c2.m)
+    assert sig1.obj is c1 and sig2.obj is c2
+    assert sig1.cls is C
+    assert sig1.arg_names is sig2.arg_names
+    assert sig1.signature()==sig2.signature()=="self, x, y"
+    assert sig1.max_args_num(include_keywords=False)==2
+    assert sig1.get_defaults_list()==[2]
+    assert sig1.max_args_num()==2
+    assert sig1.mandatory_args_num()==1
+    usig=functions.funcsig(C.m)
+    assert usig.obj is None
+    assert usig.max_args_num()==3
+    assert functions.call_cut_args(c1.m,1,3,4,z=5)==4
+    assert functions.call_cut_args(c1.m,1,y=3,z=5)==4
+
+def test_getargsfrom():
+    """Test copying of a signature onto a wrapping function"""
+    def f(a, b=2, *args, **kwargs):
+        """f doc"""
+        return a+b
+    @functions.getargsfrom(f)
+    def wrapper(*args, **kwargs):
+        return f(*args,**kwargs)*2
+    assert wrapper.__name__=="f"
+    assert wrapper.__qualname__=="f"
+    assert wrapper.__doc__=="f doc"
+    assert list(functions.funcsig(wrapper).arg_names)==["a","b"]
+    assert wrapper(1)==6
+    assert wrapper(1,b=3)==8
+
+class _PropClass(object):
+    def __init__(self):
+        self._x=1
+    @property
+    def x(self):
+        return self._x
+    @x.setter
+    def x(self, value):
+        self._x=value
+    def get_x(self):
+        return self._x
+
+def test_object_calls():
+    """Test method and attribute object calls, their subclasses and pickling"""
+    obj=_PropClass()
+    assert functions.MethodObjectCall("get_x")(obj)==1
+    assert functions.MethodObjectCall(method=_PropClass.get_x)(obj)==1
+    functions.AttrObjectCall("x",as_getter=False)(obj,2)
+    assert functions.AttrObjectCall("x",True)(obj)==2
+    class ScaledMethodCall(functions.MethodObjectCall):
+        def __init__(self, scale, method):
+            functions.MethodObjectCall.__init__(self,method)
+            self.scale=scale
+        def __call__(self, obj, *args, **vargs):
+            return functions.MethodObjectCall.__call__(self,obj,*args,**vargs)*self.scale
+    assert ScaledMethodCall(3,"get_x")(obj)==6
+    class LabeledAttrCall(functions.AttrObjectCall):
+        def __init__(self, label, name, as_getter=True):
+            functions.AttrObjectCall.__init__(self,name,as_getter)
+            self.label=label
+    call=LabeledAttrCall("label","x")
+    assert call.label=="label"
+    assert call(obj)==2
+    for protocol in range(pickle.HIGHEST_PROTOCOL+1):
+        for as_getter in [True,False]:
+            call=functions.AttrObjectCall("x",as_getter)
+            args=() if as_getter else (3,)
+            call(obj,*args)
+            ucall=pickle.loads(pickle.dumps(call,protocol))
+            assert type(ucall) is type(call)
+            assert (ucall.name,ucall.as_getter)==("x",as_getter)
+            ucall(obj,*args)
+    assert obj.x==3
+    getter=functions.AttrObjectCall("x",True)
+    for cobj,value in [(obj,3),(_PlainClass(),10),(obj,3)]:
+        assert getter(cobj)==value
+
+class _ScaledDescriptor(object):
+    """Property-like descriptor with getter and setter taking additional arguments"""
+    def fget(self, obj, scale=1):
+        return obj.d_value*scale
+    def fset(self, obj, value, scale=1):
+        obj.d_value=value*scale
+    def __get__(self, obj, cls=None):
+        return self if obj is None else self.fget(obj)
+class _DescriptorClass(object):
+    d=_ScaledDescriptor()
+    def __init__(self):
+        self.d_value=10
+
+def test_attr_calls_descriptor():
+    """Test attribute calls with property-like descriptors"""
+    obj=_DescriptorClass()
+    assert functions.getattr_call(obj,"d",3)==30
+    assert functions.AttrObjectCall("d",True)(obj,3)==30
+    assert functions.AttrObjectProperty("d").get(obj,3)==30
+    functions.setattr_call(obj,"d",2,5)
+    assert obj.d_value==10
+    functions.AttrObjectProperty("d").set(obj,(3,2))
+    assert obj.d_value==6
+    functions.AttrObjectCall("d",False)(obj,2,scale=2)
+    assert obj.d==4
+
+class _PlainClass(object):
+    def __init__(self):
+        self.x=10
+
+def test_attr_property_classes():
+    """Test attribute object properties used with objects of alternating classes"""
+    prop=functions.AttrObjectProperty("x")
+    pobj,aobj=_PropClass(),_PlainClass()
+    for i in range(3):
+        assert prop.get(pobj)==1+i
+        assert prop.get(aobj)==10+i
+        prop.set(aobj,11+i)
+        prop.set(pobj,(2+i,))
+    assert type(pobj).x.fget(pobj)==4
+    assert aobj.__dict__=={"x":13}
+
+def test_attr_property_pickle():
+    """Test pickling of attribute object properties"""
+    obj=_PropClass()
+    for protocol in range(pickle.HIGHEST_PROTOCOL+1):
+        for expand_tuple in [True,False]:
+            prop=functions.AttrObjectProperty("x",use_remover=False,expand_tuple=expand_tuple)
+            prop.set(obj,2)
+            uprop=pickle.loads(pickle.dumps(prop,protocol))
+            assert (uprop.name,uprop.use_remover,uprop.expand_tuple)==("x",False,expand_tuple)
+            uprop.set(obj,3)
+            assert uprop.get(obj)==3
+            with pytest.raises(RuntimeError):
+                uprop.rem(obj)
+
+_delayed_module_code="""
+@delaydef
+def add(*args, **kwargs):
+    def add(a, b):
+        return a+b
+    return add
+@delaydef
+def mul(*args, **kwargs):
+    def mul(a, b):
+        return a*b
+    return mul
+"""
+def test_delaydef_module():
+    """Test substitution of delayed definitions in the defining module"""
+    module=types.ModuleType("delayed_module")
+    module.delaydef=functions.delaydef
+    exec(_delayed_module_code,module.__dict__)
+    delayed_add=module.add
+    assert delayed_add(1,2)==3
+    assert module.add is not delayed_add
+    assert module.add is delayed_add.__wrapped__
+    assert module.add(2,3)==5
+    assert delayed_add(3,4)==7
+    delayed_mul=module.mul
+    def other_mul(a, b):
+        return -a*b
+    module.mul=other_mul
+    assert delayed_mul(2,3)==6
+    assert module.mul is other_mul
+    assert delayed_mul.__wrapped__(2,4)==8
+
+@pytest.mark.parametrize("use_numba",[True,False])
+def test_delaydef_jit(use_numba, monkeypatch):
+    """Test delayed definition of compiled functions taking arguments"""
+    if not use_numba:
+        monkeypatch.setitem(sys.modules,"numba",None) # makes numba import fail
+    generated=[]
+    @functions.delaydef(jit=True)
+    def add(*args, **kwargs):
+        generated.append(None)
+        def add(a, b):
+            return a+b
+        return add
+    assert not generated
+    assert add(1,2)==3
+    assert add(3,4)==7
+    assert len(generated)==1
+    if use_numba:
+        pytest.importorskip("numba")
+        assert not isinstance(add.__wrapped__,types.FunctionType)
+    else:
+        assert isinstance(add.__wrapped__,types.FunctionType)
+
+def test_weakrefs():
+    """Test that signatures and object calls and properties support weak references"""
+    def f(a, b=1):
+        return a+b
+    objects=[functions.funcsig(f),functions.MethodObjectCall("get_x"),functions.MethodObjectCall(f),
+        functions.AttrObjectCall("x",True),functions.AttrObjectCall("x",False),
+        functions.MethodObjectProperty(f),functions.AttrObjectProperty("x")]
+    for o in objects:
+        assert weakref.ref(o)() is o
+
+def test_object_properties():
+    """Test method and attribute object properties and their subclasses"""
+    calls=[]
+    def getter(obj, *args):
+        calls.append(("get",args))
+        return len(calls)
+    def setter(obj, *args):
+        calls.append(("set",args))
+    for expand_tuple in [True,False]:
+        del calls[:]
+        prop=functions.MethodObjectProperty(getter,setter,expand_tuple=expand_tuple)
+        prop.get(None)
+        prop.get(None,(1,2))
+        prop.set(None,(3,4))
+        exp_args=[(1,2),(3,4)] if expand_tuple else [((1,2),),((3,4),)]
+        assert calls==[("get",()),("get",exp_args[0]),("set",exp_args[1])]
+        with pytest.raises(RuntimeError):
+            prop.rem(None)
+        obj=_PropClass()
+        aprop=functions.AttrObjectProperty("x",True,False,True,expand_tuple)
+        assert aprop.get(obj)==1
+        with pytest.raises(RuntimeError):
+            aprop.set(obj,2)
+    class DefaultMethodProperty(functions.MethodObjectProperty):
+        def __init__(self, default, getter):
+            functions.MethodObjectProperty.__init__(self,getter)
+            self.default=default
+        def get(self, obj, params=None):
+            value=functions.MethodObjectProperty.get(self,obj,params)
+            return self.default if value is None else value
+    prop=DefaultMethodProperty(5,lambda obj: obj)
+    assert prop.get(None)==5
+    assert prop.get(2)==2
+    assert prop(None)==5
+    class DoubledAttrProperty(functions.AttrObjectProperty):
+        def get(self, obj, params=None):
+            return functions.AttrObjectProperty.get(self,obj,params)*2
+    assert DoubledAttrProperty("x",expand_tuple=False).get(_PropClass())==2
+
+def test_precompute_signatures():
+    """Test that only Python functions and methods are stored in the signature cache"""
+    def f(a, b=1):
+        return a+b
+    cache=functions._signature_cache[True]
+    functions.precompute_signatures([f,_PropClass().get_x])
+    assert f in cache
+    assert _PropClass.get_x in cache
+    cached=set(cache.keys())
+    class Callable(object):
+        def __call__(self, x):
+            return x
+    pf,cf=functools.partial(f,1),Callable()
+    pf.__name__=cf.__name__="func" # needed to get the signature
+    functions.precompute_signatures([len,pf,cf])
+    assert set(cache.keys())==cached
+
+def test_signature_arg_names():
+    """Test that argument names are stored as shared tuples for all signatures"""
+    def f(a, b=1):
+        return a+b
+    sig=functions.FunctionSignature(arg_names=["a","b"],defaults={"b":1})
+    assert sig.arg_names==("a","b")
+    assert sig.kwonly_arg_names==()
+    assert sig.arg_names is functions.funcsig(f).arg_names
+    assert sig.copy().arg_names is sig.arg_names
+    merged,_=functions.FunctionSignature.merge(sig,functions.FunctionSignature(arg_names=["c"]))
+    assert isinstance(merged.arg_names,tuple)
+    assert functions.FunctionSignature().arg_names==()
+
+def test_signature_pickle():
+    """Test pickling of function signatures"""
+    def f(a, b=1, *args, **kwargs):
+        return a+b
+    obj=_PropClass()
+    for protocol in range(pickle.HIGHEST_PROTOCOL+1):
+        for sig in [functions.FunctionSignature(["a"]),functions.funcsig(f),functions.funcsig(obj.get_x)]:
+            sig.max_args_num()
+            usig=pickle.loads(pickle.dumps(sig,protocol))
+            assert usig.arg_names is sig.arg_names
+            assert (usig.defaults,usig.varg_name,usig.kwarg_name,usig.name,usig.doc)==(sig.defaults,sig.varg_name,sig.kwarg_name,sig.name,sig.doc)
+            assert usig.max_args_num()==sig.max_args_num()
+            assert usig.signature()==sig.signature()
+    usig=pickle.loads(pickle.dumps(functions.funcsig(f),0))
+    assert usig.wrap_function(f)(2)==3